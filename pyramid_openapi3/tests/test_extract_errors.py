@@ -9,52 +9,73 @@ from pyramid_openapi3.exceptions import RequestValidationError
 from webtest.app import TestApp
 
 import json
+import os
 import tempfile
 import typing as t
 import unittest
 
+_TAKEN_NAMES = frozenset({"alice", "bob"})
 
-def app(spec: str, view: t.Callable, route: str) -> Router:
-    """Prepare a Pyramid app."""
+
+def app(
+    spec: str,
+    view: t.Callable,
+    routes: dict[str, str],
+    setup: t.Callable[[Configurator], None] | None = None,
+) -> Router:
+    """Prepare a Pyramid app that serves the view on every given route."""
     with Configurator() as config:
         config.include("pyramid_openapi3")
         config.pyramid_openapi3_spec(spec)
-        config.add_route("foo", route)
-        config.add_view(openapi=True, renderer="json", view=view, route_name="foo")
+        if setup is not None:
+            setup(config)
+        for name, pattern in routes.items():
+            config.add_route(name, pattern)
+            config.add_view(openapi=True, renderer="json", view=view, route_name=name)
         return config.make_wsgi_app()
 
 
+def _write_spec(cls: type[unittest.TestCase], document: bytes) -> str:
+    """Write a spec to a temporary file that lives as long as the class."""
+    tmpdir = tempfile.TemporaryDirectory()
+    cls.addClassCleanup(tmpdir.cleanup)
+    spec = os.path.join(tmpdir.name, "openapi.yaml")
+    with open(spec, "wb") as f:
+        f.write(document)
+    return spec
+
+
 class BadRequestsTests(unittest.TestCase):
     """A suite of tests that make sure bad requests are handled."""
 
     def foo(*args) -> None:  # noqa: D102
         return None  # pragma: no cover
 
-    OPENAPI_YAML = """
+    OPENAPI_YAML = b"""
         openapi: "3.1.0"
         info:
           version: "1.0.0"
           title: Foo
         paths:
           {endpoints}
+        components:
+          schemas:
+            bar:
+              required:
+                - bam
+              type: object
+              properties:
+                bam:
+                  type: number
+          securitySchemes:
+            Token:
+              type: apiKey
+              name: Authorization
+              in: header
     """
 
-    def _testapp(
-        self, view: t.Callable, endpoints: str, route: str = "/foo"
-    ) -> TestApp:
-        """Start up the app so that tests can send requests to it."""
-        from webtest import TestApp
-
-        with tempfile.NamedTemporaryFile() as document:
-            document.write(self.OPENAPI_YAML.format(endpoints=endpoints).encode())
-            document.seek(0)
-
-            return TestApp(app(document.name, view, route))
-
-    def test_missing_query_parameter(self) -> None:
-        """Render nice ValidationError if query parameter is missing."""
-        endpoints = """
-          /foo:
+    ENDPOINTS: t.ClassVar[dict[str, str]] = {
+        "/missing_query_parameter": """
             post:
               parameters:
                 - name: bar
@@ -67,21 +88,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post("/foo", status=400)
-        assert res.json == [
-            {
-                "exception": "MissingRequiredParameter",
-                "message": "Missing required query parameter: bar",
-                "field": "bar",
-            }
-        ]
-
-    def test_invalid_query_parameter(self) -> None:
-        """Render nice ValidationError if query parameter is invalid."""
-        endpoints = """
-          "/foo":
+        """,
+        "/invalid_query_parameter": """
             post:
               parameters:
                 - name: bar
@@ -94,21 +102,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post("/foo", status=400)
-        assert res.json == [
-            {
-                "exception": "MissingRequiredParameter",
-                "message": "Missing required query parameter: bar",
-                "field": "bar",
-            }
-        ]
-
-    def test_invalid_path_parameter(self) -> None:
-        """Render nice ValidationError if path parameter is invalid."""
-        endpoints = """
-          "/foo/{bar}":
+        """,
+        "/invalid_path_parameter/{bar}": """
             post:
               parameters:
                 - name: bar
@@ -121,23 +116,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(
-            view=self.foo, endpoints=endpoints, route="/foo/{bar}"
-        ).post("/foo/not_a_number", status=400)
-        assert res.json == [
-            {
-                "exception": "ParameterValidationError",
-                "message": "Failed to cast value to integer type: not_a_number",
-                "field": "bar",
-            }
-        ]
-
-    def test_invalid_path_parameter_regex(self) -> None:
-        """Render nice ValidationError if path parameter does not match regex."""
-        endpoints = """
-          "/foo/{bar}":
+        """,
+        "/invalid_path_parameter_regex/{bar}": """
             post:
               parameters:
                 - name: bar
@@ -151,23 +131,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(
-            view=self.foo, endpoints=endpoints, route="/foo/{bar}"
-        ).post("/foo/not-a-valid-uuid", status=400)
-        assert res.json == [
-            {
-                "exception": "ValidationError",
-                "message": "'not-a-valid-uuid' does not match '^[0-9]{2}-[A-F]{4}$'",
-                "field": "bar",
-            }
-        ]
-
-    def test_invalid_path_parameter_uuid(self) -> None:
-        """Render nice ValidationError if path parameter is not UUID."""
-        endpoints = """
-          "/foo/{bar}":
+        """,
+        "/invalid_path_parameter_uuid/{bar}": """
             post:
               parameters:
                 - name: bar
@@ -181,23 +146,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(
-            view=self.foo, endpoints=endpoints, route="/foo/{bar}"
-        ).post("/foo/not-a-valid-uuid", status=400)
-        assert res.json == [
-            {
-                "exception": "ValidationError",
-                "message": "badly formed hexadecimal UUID string",
-                "field": "bar",
-            }
-        ]
-
-    def test_missing_header_parameter(self) -> None:
-        """Render nice ValidationError if header parameter is missing."""
-        endpoints = """
-          "/foo":
+        """,
+        "/missing_header_parameter": """
             post:
               parameters:
                 - name: bar
@@ -210,21 +160,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post("/foo", status=400)
-        assert res.json == [
-            {
-                "exception": "MissingRequiredParameter",
-                "message": "Missing required header parameter: bar",
-                "field": "bar",
-            }
-        ]
-
-    def test_missing_cookie_parameter(self) -> None:
-        """Render nice ValidationError if cookie parameter is missing."""
-        endpoints = """
-          "/foo":
+        """,
+        "/missing_cookie_parameter": """
             post:
               parameters:
                 - name: bar
@@ -237,21 +174,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post("/foo", status=400)
-        assert res.json == [
-            {
-                "exception": "MissingRequiredParameter",
-                "message": "Missing required cookie parameter: bar",
-                "field": "bar",
-            }
-        ]
-
-    def test_missing_POST_parameter(self) -> None:
-        """Render nice ValidationError if POST parameter is missing."""
-        endpoints = """
-          "/foo":
+        """,
+        "/missing_POST_parameter": """
             post:
               requestBody:
                 required: true
@@ -270,23 +194,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post_json(
-            "/foo", {}, status=400
-        )
-        assert res.json == [
-            {
-                "exception": "ValidationError",
-                "message": "'foo' is a required property",
-                "field": "foo",
-            }
-        ]
-
-    def test_missing_type_POST_parameter(self) -> None:
-        """Render nice ValidationError if POST parameter is of invalid type."""
-        endpoints = """
-          "/foo":
+        """,
+        "/missing_type_POST_parameter": """
             post:
               requestBody:
                 required: true
@@ -305,23 +214,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post_json(
-            "/foo", {"foo": 1}, status=400
-        )
-        assert res.json == [
-            {
-                "exception": "ValidationError",
-                "message": "1 is not of type 'string'",
-                "field": "foo",
-            }
-        ]
-
-    def test_invalid_length_POST_parameter(self) -> None:
-        """Render nice ValidationError if POST parameter is of invalid length."""
-        endpoints = """
-          "/foo":
+        """,
+        "/invalid_length_POST_parameter": """
             post:
               requestBody:
                 required: true
@@ -339,23 +233,8 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-
-        res = self._testapp(view=self.foo, endpoints=endpoints).post_json(
-            "/foo", {"foo": "12"}, status=400
-        )
-        assert res.json == [
-            {
-                "exception": "ValidationError",
-                "message": "'12' is too short",
-                "field": "foo",
-            }
-        ]
-
-    def test_multiple_errors(self) -> None:
-        """Render a list of errors if there are more than one."""
-        endpoints = """
-          /foo:
+        """,
+        "/multiple_errors": """
             post:
               requestBody:
                 required: true
@@ -384,9 +263,176 @@ class BadRequestsTests(unittest.TestCase):
                   description: Say hello
                 400:
                   description: Bad Request
-        """
-        res = self._testapp(view=self.foo, endpoints=endpoints).post_json(
-            "/foo?bam=abc", {"foo": "1234"}, status=400
+        """,
+        "/bad_JWT_token": """
+            get:
+              security:
+                - Token:
+                    []
+              responses:
+                200:
+                  description: Say hello
+                401:
+                  description: Unauthorized
+        """,
+        "/lists": """
+            post:
+              requestBody:
+                description: A list of bars
+                content:
+                  application/json:
+                    schema:
+                      required:
+                        - foo
+                      type: object
+                      properties:
+                        foo:
+                          type: array
+                          items:
+                            $ref: "#/components/schemas/bar"
+              responses:
+                200:
+                  description: Say hello
+                400:
+                  description: Bad Request
+        """,
+    }
+
+    # Assembled once, when the class is defined.
+    SPEC = OPENAPI_YAML.replace(
+        b"{endpoints}",
+        "".join(
+            f'\n          "{path}":{item}' for path, item in ENDPOINTS.items()
+        ).encode(),
+    )
+
+    app: TestApp
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build a single app that serves every endpoint variant above."""
+        spec = _write_spec(cls, cls.SPEC)
+        routes = {path.split("/")[1]: path for path in cls.ENDPOINTS}
+        cls.app = TestApp(app(spec, cls.foo, routes))
+
+    def test_missing_query_parameter(self) -> None:
+        """Render nice ValidationError if query parameter is missing."""
+        res = self.app.post("/missing_query_parameter", status=400)
+        assert res.json == [
+            {
+                "exception": "MissingRequiredParameter",
+                "message": "Missing required query parameter: bar",
+                "field": "bar",
+            }
+        ]
+
+    def test_invalid_query_parameter(self) -> None:
+        """Render nice ValidationError if query parameter is invalid."""
+        res = self.app.post("/invalid_query_parameter", status=400)
+        assert res.json == [
+            {
+                "exception": "MissingRequiredParameter",
+                "message": "Missing required query parameter: bar",
+                "field": "bar",
+            }
+        ]
+
+    def test_invalid_path_parameter(self) -> None:
+        """Render nice ValidationError if path parameter is invalid."""
+        res = self.app.post("/invalid_path_parameter/not_a_number", status=400)
+        assert res.json == [
+            {
+                "exception": "ParameterValidationError",
+                "message": "Failed to cast value to integer type: not_a_number",
+                "field": "bar",
+            }
+        ]
+
+    def test_invalid_path_parameter_regex(self) -> None:
+        """Render nice ValidationError if path parameter does not match regex."""
+        res = self.app.post(
+            "/invalid_path_parameter_regex/not-a-valid-uuid", status=400
+        )
+        assert res.json == [
+            {
+                "exception": "ValidationError",
+                "message": "'not-a-valid-uuid' does not match '^[0-9]{2}-[A-F]{4}$'",
+                "field": "bar",
+            }
+        ]
+
+    def test_invalid_path_parameter_uuid(self) -> None:
+        """Render nice ValidationError if path parameter is not UUID."""
+        res = self.app.post("/invalid_path_parameter_uuid/not-a-valid-uuid", status=400)
+        assert res.json == [
+            {
+                "exception": "ValidationError",
+                "message": "badly formed hexadecimal UUID string",
+                "field": "bar",
+            }
+        ]
+
+    def test_missing_header_parameter(self) -> None:
+        """Render nice ValidationError if header parameter is missing."""
+        res = self.app.post("/missing_header_parameter", status=400)
+        assert res.json == [
+            {
+                "exception": "MissingRequiredParameter",
+                "message": "Missing required header parameter: bar",
+                "field": "bar",
+            }
+        ]
+
+    def test_missing_cookie_parameter(self) -> None:
+        """Render nice ValidationError if cookie parameter is missing."""
+        res = self.app.post("/missing_cookie_parameter", status=400)
+        assert res.json == [
+            {
+                "exception": "MissingRequiredParameter",
+                "message": "Missing required cookie parameter: bar",
+                "field": "bar",
+            }
+        ]
+
+    def test_missing_POST_parameter(self) -> None:
+        """Render nice ValidationError if POST parameter is missing."""
+        res = self.app.post_json("/missing_POST_parameter", {}, status=400)
+        assert res.json == [
+            {
+                "exception": "ValidationError",
+                "message": "'foo' is a required property",
+                "field": "foo",
+            }
+        ]
+
+    def test_missing_type_POST_parameter(self) -> None:
+        """Render nice ValidationError if POST parameter is of invalid type."""
+        res = self.app.post_json("/missing_type_POST_parameter", {"foo": 1}, status=400)
+        assert res.json == [
+            {
+                "exception": "ValidationError",
+                "message": "1 is not of type 'string'",
+                "field": "foo",
+            }
+        ]
+
+    def test_invalid_length_POST_parameter(self) -> None:
+        """Render nice ValidationError if POST parameter is of invalid length."""
+        res = self.app.post_json(
+            "/invalid_length_POST_parameter", {"foo": "12"}, status=400
+        )
+        assert res.json == [
+            {
+                "exception": "ValidationError",
+                "message": "'12' is too short",
+                "field": "foo",
+            }
+        ]
+
+    def test_multiple_errors(self) -> None:
+        """Render a list of errors if there are more than one."""
+        res = self.app.post_json(
+            "/multiple_errors?bam=abc", {"foo": "1234"}, status=400
         )
         assert res.json == [
             {
@@ -413,25 +459,7 @@ class BadRequestsTests(unittest.TestCase):
 
     def test_bad_JWT_token(self) -> None:
         """Render 401 on bad JWT token."""
-        endpoints = """
-          /foo:
-            get:
-              security:
-                - Token:
-                    []
-              responses:
-                200:
-                  description: Say hello
-                401:
-                  description: Unauthorized
-        components:
-          securitySchemes:
-            Token:
-              type: apiKey
-              name: Authorization
-              in: header
-        """
-        res = self._testapp(view=self.foo, endpoints=endpoints).get("/foo", status=401)
+        res = self.app.get("/bad_JWT_token", status=401)
         assert res.json == [
             {
                 "exception": "SecurityValidationError",
@@ -441,39 +469,8 @@ class BadRequestsTests(unittest.TestCase):
 
     def test_lists(self) -> None:
         """Error extracting works for lists too."""
-        endpoints = """
-          /foo:
-            post:
-              requestBody:
-                description: A list of bars
-                content:
-                  application/json:
-                    schema:
-                      required:
-                        - foo
-                      type: object
-                      properties:
-                        foo:
-                          type: array
-                          items:
-                            $ref: "#/components/schemas/bar"
-              responses:
-                200:
-                  description: Say hello
-                400:
-                  description: Bad Request
-        components:
-          schemas:
-            bar:
-              required:
-                - bam
-              type: object
-              properties:
-                bam:
-                  type: number
-        """
-        res = self._testapp(view=self.foo, endpoints=endpoints).post_json(
-            "/foo", {"foo": [{"bam": "not a number"}]}, status=400
+        res = self.app.post_json(
+            "/lists", {"foo": [{"bam": "not a number"}]}, status=400
         )
 
         assert res.json == [
@@ -507,15 +504,23 @@ class BadResponsesTests(unittest.TestCase):
                         type: string
     """
 
-    def _testapp(self, view: t.Callable) -> TestApp:
-        """Start up the app so that tests can send requests to it."""
-        from webtest import TestApp
+    app: TestApp
+    current_view: t.Callable
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the app once, dispatching to the view set by each test."""
 
-        with tempfile.NamedTemporaryFile() as document:
-            document.write(self.OPENAPI_YAML)
-            document.seek(0)
+        def dispatch(*args: t.Any) -> t.Any:
+            return cls.current_view(*args)
 
-            return TestApp(app(document.name, view, route="/foo"))
+        spec = _write_spec(cls, cls.OPENAPI_YAML)
+        cls.app = TestApp(app(spec, dispatch, {"foo": "/foo"}))
+
+    def _testapp(self, view: t.Callable) -> TestApp:
+        """Route requests to the given view and return the shared app."""
+        type(self).current_view = view
+        return self.app
 
     def test_foo(self) -> None:
         """Say foo."""
@@ -560,17 +565,19 @@ class BadResponsesTests(unittest.TestCase):
 class CustomFormattersTests(unittest.TestCase):
     """A suite of tests that showcase how custom formatters can be used."""
 
-    def hello(self, context: t.Any, request: Request) -> str:
+    @staticmethod
+    def hello(_context: t.Any, request: Request) -> str:
         """Say hello."""
         return f"Hello {request.openapi_validated.body['name']}"
 
-    def unique_name(self, name: str) -> bool:
+    @staticmethod
+    def unique_name(name: str) -> bool:
         """Ensure name is unique."""
         if not isinstance(name, str):
             return True  # Only check strings (let default validation handle others)
 
         name = name.lower()
-        if name in ["alice", "bob"]:
+        if name in _TAKEN_NAMES:
             raise RequestValidationError(
                 errors=[
                     InvalidCustomFormatterValue(
@@ -585,7 +592,7 @@ class CustomFormattersTests(unittest.TestCase):
             )
         return True
 
-    OPENAPI_YAML = """
+    OPENAPI_YAML = b"""
         openapi: "3.1.0"
         info:
           version: "1.0.0"
@@ -613,34 +620,30 @@ class CustomFormattersTests(unittest.TestCase):
                   description: Bad Request
     """
 
-    def _testapp(self) -> TestApp:
-        """Start up the app so that tests can send requests to it."""
-        from webtest import TestApp
-
-        with tempfile.NamedTemporaryFile() as document:
-            document.write(self.OPENAPI_YAML.encode())
-            document.seek(0)
-
-            with Configurator() as config:
-                config.include("pyramid_openapi3")
-                config.pyramid_openapi3_spec(document.name)
-                config.pyramid_openapi3_add_formatter("unique-name", self.unique_name)
-                config.add_route("hello", "/hello")
-                config.add_view(
-                    openapi=True, renderer="json", view=self.hello, route_name="hello"
-                )
-                app = config.make_wsgi_app()
-
-            return TestApp(app)
+    app: TestApp
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the app once for the whole class."""
+        cls.app = TestApp(
+            app(
+                _write_spec(cls, cls.OPENAPI_YAML),
+                cls.hello,
+                {"hello": "/hello"},
+                setup=lambda config: config.pyramid_openapi3_add_formatter(
+                    "unique-name", cls.unique_name
+                ),
+            )
+        )
 
     def test_say_hello(self) -> None:
         """Test happy path."""
-        res = self._testapp().post_json("/hello", {"name": "zupo"}, status=200)
+        res = self.app.post_json("/hello", {"name": "zupo"}, status=200)
         assert res.json == "Hello zupo"
 
     def test_name_taken(self) -> None:
         """Test passing a name that is taken."""
-        res = self._testapp().post_json("/hello", {"name": "Alice"}, status=400)
+        res = self.app.post_json("/hello", {"name": "Alice"}, status=400)
         assert res.json == [
             {
                 "exception": "InvalidCustomFormatterValue",
@@ -651,7 +654,7 @@ class CustomFormattersTests(unittest.TestCase):
 
     def test_invalid_name(self) -> None:
         """Test that built-in type formatters do their job."""
-        res = self._testapp().post_json("/hello", {"name": 12}, status=400)
+        res = self.app.post_json("/hello", {"name": 12}, status=400)
         assert res.json == [
             {
                 "exception": "ValidationError",
@@ -660,7 +663,7 @@ class CustomFormattersTests(unittest.TestCase):
             }
         ]
 
-        res = self._testapp().post_json("/hello", {"name": "yo"}, status=400)
+        res = self.app.post_json("/hello", {"name": "yo"}, status=400)
         assert res.json == [
             {
                 "exception": "ValidationError",
@@ -673,9 +676,10 @@ class CustomFormattersTests(unittest.TestCase):
 class CustomDeserializerTests(unittest.TestCase):
     """A suite of tests that showcase how custom deserializers can be used."""
 
-    def hello(self, context: t.Any, request: Request) -> str:
+    @classmethod
+    def hello(cls, _context: t.Any, request: Request) -> str:
         """Say hello."""
-        result = self.reverse(f"Hello {request.openapi_validated.body['name']}")
+        result = cls.reverse(f"Hello {request.openapi_validated.body['name']}")
         request.response.content_type = "application/backwards+json"
         return result
 
@@ -684,7 +688,7 @@ class CustomDeserializerTests(unittest.TestCase):
         """Reverse a string."""
         return s[::-1]
 
-    OPENAPI_YAML = """
+    OPENAPI_YAML = b"""
         openapi: "3.1.0"
         info:
           version: "1.0.0"
@@ -714,48 +718,45 @@ class CustomDeserializerTests(unittest.TestCase):
                   description: Bad Request
     """
 
-    def _testapp(self) -> TestApp:
-        """Start up the app so that tests can send requests to it."""
-        from webtest import TestApp
-
-        with tempfile.NamedTemporaryFile() as document:
-            document.write(self.OPENAPI_YAML.encode())
-            document.seek(0)
-
-            with Configurator() as config:
-                config.include("pyramid_openapi3")
-                config.pyramid_openapi3_spec(document.name)
-                config.pyramid_openapi3_add_deserializer(
-                    "application/backwards+json", lambda x: json.loads(self.reverse(x))
-                )
-                config.add_route("hello", "/hello")
-                config.add_view(
-                    openapi=True, renderer="json", view=self.hello, route_name="hello"
-                )
-                app = config.make_wsgi_app()
-
-            return TestApp(app)
+    app: TestApp
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the app once for the whole class."""
+        spec = _write_spec(cls, cls.OPENAPI_YAML)
+        cls.app = TestApp(
+            app(
+                spec,
+                cls.hello,
+                {"hello": "/hello"},
+                setup=lambda config: config.pyramid_openapi3_add_deserializer(
+                    "application/backwards+json", lambda x: json.loads(cls.reverse(x))
+                ),
+            )
+        )
 
     def test_say_hello(self) -> None:
         """Test happy path."""
         headers = {"Content-Type": "application/backwards+json"}
         body = self.reverse(json.dumps({"name": "zupo"}))
-        res = self._testapp().post("/hello", body, headers, status=200)
+        res = self.app.post("/hello", body, headers, status=200)
         assert res.json == self.reverse("Hello zupo")
 
 
 class CustomUnmarshallersTests(unittest.TestCase):
     """A suite of tests that showcase how custom unmarshallers can be used."""
 
-    def hello(self, context: t.Any, request: Request) -> str:
+    @staticmethod
+    def hello(_context: t.Any, request: Request) -> str:
         """Say hello."""
         return f"Hello {request.openapi_validated.body['id']}"
 
-    def parse_id(self, id_: str) -> str:
+    @staticmethod
+    def parse_id(id_: str) -> str:
         """Expand id parameter."""
         return id_.strip("[]").replace(",", " and ")
 
-    OPENAPI_YAML = """
+    OPENAPI_YAML = b"""
         openapi: "3.1.0"
         info:
           version: "1.0.0"
@@ -782,27 +783,24 @@ class CustomUnmarshallersTests(unittest.TestCase):
                   description: Bad Request
     """
 
-    def _testapp(self) -> TestApp:
-        """Start up the app so that tests can send requests to it."""
-        from webtest import TestApp
-
-        with tempfile.NamedTemporaryFile() as document:
-            document.write(self.OPENAPI_YAML.encode())
-            document.seek(0)
-
-            with Configurator() as config:
-                config.include("pyramid_openapi3")
-                config.pyramid_openapi3_spec(document.name)
-                config.pyramid_openapi3_add_unmarshaller("parse-id", self.parse_id)
-                config.add_route("hello", "/hello")
-                config.add_view(
-                    openapi=True, renderer="json", view=self.hello, route_name="hello"
-                )
-                app = config.make_wsgi_app()
-
-            return TestApp(app)
+    app: TestApp
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the app once for the whole class."""
+        spec = _write_spec(cls, cls.OPENAPI_YAML)
+        cls.app = TestApp(
+            app(
+                spec,
+                cls.hello,
+                {"hello": "/hello"},
+                setup=lambda config: config.pyramid_openapi3_add_unmarshaller(
+                    "parse-id", cls.parse_id
+                ),
+            )
+        )
 
     def test_say_hello(self) -> None:
         """Test happy path."""
-        res = self._testapp().post_json("/hello", {"id": "[1,2,3]"}, status=200)
+        res = self.app.post_json("/hello", {"id": "[1,2,3]"}, status=200)
         assert res.json == "Hello 1 and 2 and 3"